@@ -2,43 +2,240 @@
 
 import sys
 import os
-from pathlib import Path
+import re
 import json
 from functools import cached_property
+from itertools import islice
+from operator import itemgetter
 
 # --- BEGIN SYS.PATH MODIFICATION ---
-plugindir_path = Path(__file__).resolve().parent
-libdir = plugindir_path / 'lib'
-sys.path.insert(0, str(plugindir_path))
-if libdir.is_dir():
-    sys.path.insert(0, str(libdir))
+# Plugin directory as Flow Launcher sees it (abspath, no symlink-resolving stat chain)
+_PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
+libdir = os.path.join(_PLUGIN_DIR, 'lib')
+sys.path.insert(0, _PLUGIN_DIR)
+if os.path.isdir(libdir):
+    sys.path.insert(0, libdir)
 # --- END SYS.PATH MODIFICATION ---
 
-import webbrowser
-import requests
-from urllib.parse import quote_plus, urlunsplit, urlsplit, urlencode, parse_qsl
-from typing import List, Dict, Any, Optional, Union
+from urllib.parse import quote_plus, urlsplit
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Union, NamedTuple, Callable
 
 from flowlauncher import FlowLauncher, FlowLauncherAPI
 
+if TYPE_CHECKING:
+    import requests
+
+# requests pulls in urllib3, ssl and http.client; only import it once a request is sent
+_requests = None
+
+
+def _get_requests():
+    """Import requests on first use"""
+    global _requests
+    if _requests is None:
+        import requests
+        _requests = requests
+    return _requests
+
+
+# Optional faster JSON encoding/decoding
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        # Match orjson's output: compact separators, UTF-8 instead of \u escapes
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+# Optional incremental JSON parsing of server responses; only ijson's C backends
+# beat parsing the whole body, and the import is deferred like requests
+_IJSON_FAST_BACKENDS = ("yajl2_c", "yajl2_cffi")
+_ijson = None
+
+
+def _get_ijson():
+    """Import ijson on first use; None if it is missing or only has a pure-Python backend"""
+    global _ijson
+    if _ijson is None:
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+        _ijson = ijson if ijson is not None and ijson.backend in _IJSON_FAST_BACKENDS else False
+    return _ijson or None
+
+# Placeholders recognised in custom_url_template
+_TEMPLATE_PLACEHOLDER_RE = re.compile(r"(\{encoded_query\}|\{query\}|\{query_param_name\})")
+
+# Result fields servers usually send on every item
+_CORE_FIELDS = itemgetter("Title", "SubTitle", "IcoPath", "Score")
+
+# Plugin icon, relative to the plugin directory
+_ICON = "Images/icon.png"
+
+# Fixed results; copied before a SubTitle is filled in
+_READY_RESULT = {"Title": "HTTP Query Forwarder", "IcoPath": _ICON}
+_NO_RESULTS_RESULT = {"Title": "No results", "IcoPath": _ICON}
+_NO_CONTEXT_ACTIONS_RESULT = {"Title": "No context actions available", "IcoPath": _ICON}
+
+# Matches strings made only of characters quote_plus never escapes
+_is_safe_query = re.compile(r"[A-Za-z0-9._~ -]*").fullmatch
+
+
+def _fast_quote_plus(value: str) -> str:
+    """quote_plus that skips the encoder when nothing needs escaping"""
+    if _is_safe_query(value):
+        return value.replace(" ", "+")
+    return quote_plus(value)
+
+
+# Characters that would split an unencoded query value appended to a template URL
+_RAW_QUERY_ESCAPES = str.maketrans({"&": "%26", "#": "%23", "+": "%2B"})
+
+
+def _escape_raw_query(value: str) -> str:
+    """Escape only &, # and + so a raw query stays a single parameter value"""
+    return value.translate(_RAW_QUERY_ESCAPES)
+
+
+# String spellings accepted as true for settings and action parameters
+_TRUE_STRINGS = frozenset(("1", "true", "True", "TRUE", "yes", "Yes", "YES", "on", "On", "ON"))
+
+
+def _as_bool(value: Any) -> bool:
+    """Convert a bool-like setting or parameter, lower-casing only unusual strings"""
+    if value is True or value is False:
+        return value
+    if type(value) is str:
+        return value in _TRUE_STRINGS or value.strip().lower() in _TRUE_STRINGS
+    return bool(value)
+
+
+def _as_str(value: Any) -> str:
+    """Convert a parameter to str, reusing it when it already is one"""
+    return value if type(value) is str else str(value)
+
+
+# Default settings matching SettingsTemplate.yaml
+_DEFAULT_SETTINGS = {
+    "server_address": "http://127.0.0.1",
+    "server_port": "8080",
+    "server_path": "/",
+    "query_param_name": "q",
+    "url_encode_query": True,
+    "request_timeout": "5",
+    "custom_url_template": "",
+    "max_results": "0"
+}
+
+
+class QuerySettings(NamedTuple):
+    """Settings used by query(), already converted to their working types"""
+    server_address: str
+    server_port: str
+    server_path: str
+    query_param_name: str
+    url_encode_query: bool
+    request_timeout: int
+    custom_url_template: str
+    max_results: int
+
+
+def _load_plugin_json() -> dict:
+    """Read plugin.json once; an empty dict if it is missing or unreadable"""
+    try:
+        with open(os.path.join(_PLUGIN_DIR, 'plugin.json'), 'rb') as f:
+            data = _json_loads(f.read())
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+_PLUGIN_JSON = _load_plugin_json()
+
+
+def _read_settings_file(path: str) -> Optional[dict]:
+    """Load a Settings.json, or None if it doesn't exist"""
+    try:
+        with open(path, 'rb') as f:
+            return _json_loads(f.read())
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _error_results(title: str, sub_title: str) -> List[dict]:
+    """Build the single-entry result list shown when a query fails"""
+    return [{"Title": title, "SubTitle": sub_title, "IcoPath": _ICON}]
+
+
+def _emit_rpc(method: str, parameters: list) -> None:
+    """Write a JSON-RPC call for Flow Launcher to stdout"""
+    data = _json_dumps({"method": method, "parameters": parameters}) + b"\n"
+    
+    stdout = sys.stdout
+    buffer = getattr(stdout, "buffer", None)
+    if buffer is None:
+        stdout.write(data.decode("utf-8"))
+        return
+    # Keep ordering with anything already written through the text layer
+    stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def _iter_json_list(response, chunk_size: int = 16384):
+    """Yield the items of a top-level JSON array as the response body arrives"""
+    ijson = _get_ijson()
+    items = ijson.sendable_list()
+    parser = ijson.items_coro(items, "item", use_float=True)
+    is_list = False
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        if not is_list:
+            head = chunk.lstrip()
+            if not head:
+                continue
+            if not head.startswith(b"["):
+                raise ValueError("Server response is not a JSON list")
+            is_list = True
+        try:
+            parser.send(chunk)
+        except ijson.JSONError:
+            raise ValueError("Server response is not valid JSON") from None
+        yield from items
+        del items[:]
+    if not is_list:
+        raise ValueError("Server response is not a JSON list")
+    try:
+        parser.close()
+    except ijson.JSONError:
+        raise ValueError("Server response is not valid JSON") from None
+    yield from items
+
 
 class HttpQueryForwarder(FlowLauncher):
+
+    # Methods a server response may invoke through JsonRPCAction
+    _ALLOWED_METHODS = frozenset({
+        "open_url",
+        "shell_run",
+        "copy_to_clipboard",
+        "change_query",
+        "flow_show_msg",
+    })
+
+    _session = None
+    _settings_source = None
+    _settings_norm = None
+    _url_builder_config = None
+    _url_builder = None
     
     @cached_property
     def plugin_name(self):
         """Get the plugin name from plugin.json"""
-        try:
-            plugin_json_path = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), 
-                'plugin.json'
-            )
-            if os.path.exists(plugin_json_path):
-                with open(plugin_json_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get('Name', self.__class__.__name__)
-        except Exception:
-            pass
-        return self.__class__.__name__
+        return _PLUGIN_JSON.get('Name') or self.__class__.__name__
     
     @cached_property
     def settings(self):
@@ -52,35 +249,35 @@ class HttpQueryForwarder(FlowLauncher):
                     self.plugin_name, 'Settings.json'
                 )
                 
-                if os.path.exists(settings_path):
-                    with open(settings_path, 'r', encoding='utf-8') as f:
-                        loaded = json.load(f)
-                        # Merge with defaults to ensure all keys exist
-                        defaults = self.get_default_settings()
-                        defaults.update(loaded)
-                        return defaults
+                loaded = _read_settings_file(settings_path)
+                if loaded is not None:
+                    # Merge with defaults to ensure all keys exist
+                    defaults = self.get_default_settings()
+                    defaults.update(loaded)
+                    return defaults
             
             # Fallback method: Try relative path from plugin directory
-            plugin_dir = os.path.dirname(os.path.abspath(__file__))
-            flow_launcher_root = Path(plugin_dir).parent.parent
+            flow_launcher_root = os.path.dirname(os.path.dirname(_PLUGIN_DIR))
             
             # Try with plugin display name
-            settings_path = flow_launcher_root / 'Settings' / 'Plugins' / self.plugin_name / 'Settings.json'
-            if settings_path.exists():
-                with open(settings_path, 'r', encoding='utf-8') as f:
-                    loaded = json.load(f)
-                    defaults = self.get_default_settings()
-                    defaults.update(loaded)
-                    return defaults
+            settings_path = os.path.join(
+                flow_launcher_root, 'Settings', 'Plugins', self.plugin_name, 'Settings.json'
+            )
+            loaded = _read_settings_file(settings_path)
+            if loaded is not None:
+                defaults = self.get_default_settings()
+                defaults.update(loaded)
+                return defaults
             
             # Try with class name as last resort
-            settings_path = flow_launcher_root / 'Settings' / 'Plugins' / self.__class__.__name__ / 'Settings.json'
-            if settings_path.exists():
-                with open(settings_path, 'r', encoding='utf-8') as f:
-                    loaded = json.load(f)
-                    defaults = self.get_default_settings()
-                    defaults.update(loaded)
-                    return defaults
+            settings_path = os.path.join(
+                flow_launcher_root, 'Settings', 'Plugins', self.__class__.__name__, 'Settings.json'
+            )
+            loaded = _read_settings_file(settings_path)
+            if loaded is not None:
+                defaults = self.get_default_settings()
+                defaults.update(loaded)
+                return defaults
                     
         except Exception as e:
             # Silent fail - use defaults
@@ -90,16 +287,8 @@ class HttpQueryForwarder(FlowLauncher):
         return self.get_default_settings()
     
     def get_default_settings(self):
-        """Return default settings matching SettingsTemplate.yaml"""
-        return {
-            "server_address": "http://127.0.0.1",
-            "server_port": "8080",
-            "server_path": "/",
-            "query_param_name": "q",
-            "url_encode_query": True,
-            "request_timeout": "5",
-            "custom_url_template": ""
-        }
+        """Return a fresh copy of the default settings"""
+        return _DEFAULT_SETTINGS.copy()
     
     def get_str(self, key: str, default: str = "") -> str:
         """Get string setting with type safety"""
@@ -114,174 +303,268 @@ class HttpQueryForwarder(FlowLauncher):
     
     def get_bool(self, key: str, default: bool = False) -> bool:
         """Get boolean setting with type safety"""
-        val = self.settings.get(key, default)
-        if isinstance(val, bool):
-            return val
-        if isinstance(val, str):
-            return val.lower() in ("1", "true", "yes")
-        return bool(val)
+        return _as_bool(self.settings.get(key, default))
     
-    def query(self, param: str = "") -> List[dict]:
-        """Main query handler"""
-        # Get settings using type-safe methods
-        server_addr = self.get_str("server_address", "http://127.0.0.1")
-        server_port = self.get_str("server_port", "8080")
-        server_path = self.get_str("server_path", "/")
-        query_param_name = self.get_str("query_param_name", "q")
-        url_encode = self.get_bool("url_encode_query", True)
-        timeout = self.get_int("request_timeout", 5)
-        custom_url_template = self.get_str("custom_url_template", "")
+    def get_session(self) -> "requests.Session":
+        """Get the pooled HTTP session, creating it on first use"""
+        if self._session is None:
+            requests = _get_requests()
+            session = requests.Session()
+            session.headers["Accept"] = "application/json"
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+    
+    def get_query_settings(self) -> QuerySettings:
+        """Get the typed settings used by query(), re-normalized only when the settings are reloaded"""
+        settings = self.settings
+        if settings is self._settings_source:
+            return self._settings_norm
         
         # Ensure server_path starts with /
+        server_path = self.get_str("server_path", "/")
         if server_path and not server_path.startswith("/"):
             server_path = "/" + server_path
         
         # Validate timeout
+        timeout = self.get_int("request_timeout", 5)
         if timeout <= 0:
             timeout = 5
         
-        results = []
-        icon_path = "Images/icon.png"
+        # Zero or less means no limit
+        max_results = max(self.get_int("max_results", 0), 0)
         
-        try:
-            # Check for custom URL template
-            custom_url_template = custom_url_template.strip()
+        self._settings_norm = QuerySettings(
+            server_address=self.get_str("server_address", "http://127.0.0.1"),
+            server_port=self.get_str("server_port", "8080"),
+            server_path=server_path,
+            query_param_name=self.get_str("query_param_name", "q"),
+            url_encode_query=self.get_bool("url_encode_query", True),
+            request_timeout=timeout,
+            custom_url_template=self.get_str("custom_url_template", "").strip(),
+            max_results=max_results
+        )
+        self._settings_source = settings
+        return self._settings_norm
+    
+    def get_url_builder(self, config: QuerySettings) -> Callable[[str], str]:
+        """Get the function turning a query into the request URL, compiled once per settings"""
+        if config is not self._url_builder_config:
+            self._url_builder = self.compile_url_builder(config)
+            self._url_builder_config = config
+        return self._url_builder
+    
+    def compile_url_builder(self, config: QuerySettings) -> Callable[[str], str]:
+        """Pre-compute everything in the request URL except the query itself"""
+        encode = _fast_quote_plus if config.url_encode_query else str
+        
+        if config.custom_url_template:
+            # Use custom template
+            segments, needs_append = self.get_template_plan(config.custom_url_template, config.query_param_name)
             
-            if custom_url_template:
-                # Use custom template
-                encoded_query = quote_plus(param)
-                url = (
-                    custom_url_template
-                    .replace("{encoded_query}", encoded_query)
-                    .replace("{query}", param)
-                    .replace("{query_param_name}", query_param_name)
-                )
+            if not needs_append:
+                # Only pay for encoding when the template actually has {encoded_query}
+                uses_encoded = "{encoded_query}" in segments
+                check_scheme = segments[0] in ("{query}", "{encoded_query}")
                 
-                # Add scheme if missing
-                if not urlsplit(url).scheme:
-                    url = "http://" + url
-                    
-                # If template doesn't contain query placeholders, append query param
-                if "{query}" not in custom_url_template and "{encoded_query}" not in custom_url_template:
-                    parsed = urlsplit(url)
-                    query_value = quote_plus(param) if url_encode else param
-                    existing_qs = list(parse_qsl(parsed.query, keep_blank_values=True))
-                    existing_qs.append((query_param_name, query_value))
-                    new_query = urlencode(existing_qs, doseq=True)
-                    url = urlunsplit((parsed.scheme, parsed.netloc, parsed.path, new_query, parsed.fragment))
+                def build_url(param: str) -> str:
+                    values = {"{query}": param}
+                    if uses_encoded:
+                        values["{encoded_query}"] = _fast_quote_plus(param)
+                    url = "".join([values.get(segment, segment) for segment in segments])
+                    if check_scheme and not urlsplit(url).scheme:
+                        url = "http://" + url
+                    return url
+                return build_url
+            
+            # Template doesn't contain query placeholders, append query param
+            base, hash_mark, fragment = "".join(segments).partition("#")
+            if "?" not in base:
+                sep = "?"
+            elif base.endswith(("?", "&")):
+                sep = ""
             else:
-                # Build URL from components
-                # Ensure server_addr has a scheme
-                if not urlsplit(server_addr).scheme:
-                    server_addr = "http://" + server_addr
+                sep = "&"
+            prefix = f"{base}{sep}{config.query_param_name}="
+            suffix = hash_mark + fragment
+            if not config.url_encode_query:
+                encode = _escape_raw_query
+        else:
+            # Build URL from components; the shape is fixed, so skip urlunsplit
+            scheme, netloc, server_path = self.get_base_url_parts(
+                config.server_address, config.server_port, config.server_path
+            )
+            prefix = f"{scheme}://{netloc}{server_path}?{config.query_param_name}="
+            suffix = ""
+        
+        def build_url(param: str) -> str:
+            return prefix + encode(param) + suffix
+        return build_url
+    
+    def get_base_url_parts(self, server_addr: str, server_port: str, server_path: str) -> tuple:
+        """Get (scheme, netloc, path) for the classic settings"""
+        # Ensure server_addr has a scheme
+        if not urlsplit(server_addr).scheme:
+            server_addr = "http://" + server_addr
+        
+        parsed = urlsplit(server_addr)
+        scheme = parsed.scheme or "http"
+        host = parsed.hostname
+        
+        if not host:
+            raise ValueError(f"Invalid server address: {server_addr}")
+        
+        # Handle port
+        if parsed.port:
+            netloc = f"{host}:{parsed.port}"
+        elif server_port:
+            netloc = f"{host}:{server_port}"
+        else:
+            netloc = host
+        
+        return scheme, netloc, server_path
+    
+    def get_template_plan(self, template: str, query_param_name: str) -> tuple:
+        """Split the custom URL template into (segments, needs_append)
+        
+        Segments are literal strings, except for "{query}" and "{encoded_query}"
+        which are left in place to be swapped for the query on each request.
+        """
+        segments = []
+        literal = ""
+        for part in _TEMPLATE_PLACEHOLDER_RE.split(template):
+            if part == "{query_param_name}":
+                literal += query_param_name
+            elif part in ("{query}", "{encoded_query}"):
+                if literal:
+                    segments.append(literal)
+                segments.append(part)
+                literal = ""
+            else:
+                literal += part
+        if literal:
+            segments.append(literal)
+        
+        # Without query placeholders the query param gets appended instead
+        needs_append = "{query}" not in segments and "{encoded_query}" not in segments
+        
+        # Add scheme if missing; a leading placeholder may supply one, so that
+        # case is left for the URL builder to check once the query is filled in
+        if segments[0] not in ("{query}", "{encoded_query}") and not urlsplit("".join(segments)).scheme:
+            segments.insert(0, "http://")
+        
+        return segments, needs_append
+    
+    def query(self, param: str = "") -> List[dict]:
+        """Main query handler"""
+        config = self.get_query_settings()
+        server_addr = config.server_address
+        server_port = config.server_port
+        timeout = config.request_timeout
+        limit = config.max_results or None
+        
+        if not param.strip():
+            # Nothing typed yet: show current configuration instead of querying the server
+            port_display = f":{server_port}" if server_port else ""
+            result = _READY_RESULT.copy()
+            result["SubTitle"] = f"Ready. Server: {server_addr}{port_display}"
+            return [result]
+        
+        results = []
+        requests = _get_requests()
+        url = server_addr
+        
+        try:
+            url = self.get_url_builder(config)(param)
+            
+            # Process results; names the per-item work needs are bound as defaults
+            def _convert(item, _icon=_ICON, _allowed=self._ALLOWED_METHODS, _isinstance=isinstance,
+                         _core=_CORE_FIELDS):
+                if not _isinstance(item, dict):
+                    return None
+                get = item.get
+                try:
+                    title, sub_title, ico_path, score = _core(item)
+                except KeyError:
+                    title = get("Title")
+                    sub_title = get("SubTitle", "")
+                    ico_path = get("IcoPath", _icon)
+                    score = get("Score", 0)
+                if not title:
+                    return None
                 
-                parsed = urlsplit(server_addr)
-                scheme = parsed.scheme or "http"
-                host = parsed.hostname
+                result = {
+                    "Title": title,
+                    "SubTitle": sub_title,
+                    "IcoPath": ico_path,
+                    "Score": int(score or 0)
+                }
                 
-                if not host:
-                    raise ValueError(f"Invalid server address: {server_addr}")
+                # Add optional fields
+                auto_complete = get("AutoCompleteText")
+                if auto_complete:
+                    result["AutoCompleteText"] = auto_complete
                 
-                # Handle port
-                if parsed.port:
-                    netloc = f"{host}:{parsed.port}"
-                elif server_port:
-                    netloc = f"{host}:{server_port}"
-                else:
-                    netloc = host
+                # Handle context menu items
+                menu_items = get("ContextMenuItems")
+                if menu_items and _isinstance(menu_items, list):
+                    result["ContextData"] = {
+                        "original_data": get("ContextData"),
+                        "defined_menu_items": menu_items
+                    }
+                elif get("ContextData"):
+                    result["ContextData"] = item["ContextData"]
                 
-                # Build query string
-                query_value = quote_plus(param) if url_encode else param
-                query_string = f"{query_param_name}={query_value}"
+                # Handle actions
+                action = get("JsonRPCAction")
+                if action and _isinstance(action, dict):
+                    method = action.get("method")
+                    if method in _allowed:
+                        result["JsonRPCAction"] = {
+                            "method": method,
+                            "parameters": action.get("parameters", [])
+                        }
                 
-                # Construct final URL
-                url = urlunsplit((scheme, netloc, server_path, query_string, ''))
+                return result
             
             # Make request
-            response = requests.get(url, timeout=timeout)
-            response.raise_for_status()
-            data = response.json()
-            
-            if not isinstance(data, list):
-                raise ValueError("Server response is not a JSON list")
-            
-            # Process results
-            for item in data:
-                if isinstance(item, dict) and item.get("Title"):
-                    result = {
-                        "Title": item["Title"],
-                        "SubTitle": item.get("SubTitle", ""),
-                        "IcoPath": item.get("IcoPath", icon_path),
-                        "Score": int(item.get("Score", 0))
-                    }
-                    
-                    # Add optional fields
-                    if item.get("AutoCompleteText"):
-                        result["AutoCompleteText"] = item["AutoCompleteText"]
-                    
-                    # Handle context menu items
-                    if item.get("ContextMenuItems") and isinstance(item["ContextMenuItems"], list):
-                        result["ContextData"] = {
-                            "original_data": item.get("ContextData"),
-                            "defined_menu_items": item["ContextMenuItems"]
-                        }
-                    elif item.get("ContextData"):
-                        result["ContextData"] = item["ContextData"]
-                    
-                    # Handle actions
-                    if item.get("JsonRPCAction"):
-                        action = item["JsonRPCAction"]
-                        if isinstance(action, dict) and action.get("method"):
-                            method = action["method"]
-                            if hasattr(self, method):
-                                result["JsonRPCAction"] = {
-                                    "method": method,
-                                    "parameters": action.get("parameters", [])
-                                }
-                    
-                    results.append(result)
+            session = self.get_session()
+            if limit and _get_ijson() is not None:
+                # Stream the body so reading stops once max_results items are collected;
+                # without a limit one _json_loads of the whole body is faster
+                with session.get(url, timeout=timeout, stream=True) as response:
+                    response.raise_for_status()
+                    data = _iter_json_list(response)
+                    results = list(islice(filter(None, map(_convert, data)), limit))
+            else:
+                response = session.get(url, timeout=timeout)
+                response.raise_for_status()
+                data = _json_loads(response.content)
+                
+                if not isinstance(data, list):
+                    raise ValueError("Server response is not a JSON list")
+                
+                results = list(islice(filter(None, map(_convert, data)), limit))
             
         except requests.exceptions.Timeout:
-            results = [{
-                "Title": "Error: Request Timed Out",
-                "SubTitle": f"Server at {url if 'url' in locals() else server_addr} timed out",
-                "IcoPath": icon_path
-            }]
+            results = _error_results("Error: Request Timed Out", f"Server at {url} timed out")
         except requests.exceptions.RequestException as e:
-            results = [{
-                "Title": "Error: Network Request Failed",
-                "SubTitle": f"Could not connect to server: {str(e)[:50]}",
-                "IcoPath": icon_path
-            }]
+            results = _error_results("Error: Network Request Failed", f"Could not connect to server: {str(e)[:50]}")
         except Exception as e:
-            results = [{
-                "Title": "Error: Plugin Error",
-                "SubTitle": str(e)[:100],
-                "IcoPath": icon_path
-            }]
+            results = _error_results("Error: Plugin Error", str(e)[:100])
         
         if not results:
-            if param:
-                results = [{
-                    "Title": "No results",
-                    "SubTitle": f"No results for '{param}'",
-                    "IcoPath": icon_path
-                }]
-            else:
-                # Show current configuration in subtitle when idle
-                port_display = f":{server_port}" if server_port else ""
-                results = [{
-                    "Title": "HTTP Query Forwarder",
-                    "SubTitle": f"Ready. Server: {server_addr}{port_display}",
-                    "IcoPath": icon_path
-                }]
+            result = _NO_RESULTS_RESULT.copy()
+            result["SubTitle"] = f"No results for '{param}'"
+            results = [result]
         
         return results
 
     def context_menu(self, data: Any) -> List[dict]:
         """Handle context menu requests"""
         menu_results = []
-        icon_path = "Images/icon.png"
         
         if isinstance(data, dict) and "defined_menu_items" in data:
             for item_def in data.get("defined_menu_items", []):
@@ -289,14 +572,14 @@ class HttpQueryForwarder(FlowLauncher):
                     ctx_result = {
                         "Title": item_def["Title"],
                         "SubTitle": item_def.get("SubTitle", ""),
-                        "IcoPath": item_def.get("IcoPath", icon_path)
+                        "IcoPath": item_def.get("IcoPath", _ICON)
                     }
                     
                     json_rpc = item_def.get("JsonRPCAction")
                     if isinstance(json_rpc, dict):
                         method = json_rpc.get("method")
                         params = json_rpc.get("parameters", [])
-                        if method and hasattr(self, method):
+                        if method in self._ALLOWED_METHODS:
                             ctx_result["JsonRPCAction"] = {
                                 "method": method,
                                 "parameters": params if isinstance(params, list) else []
@@ -305,53 +588,40 @@ class HttpQueryForwarder(FlowLauncher):
                     menu_results.append(ctx_result)
         
         if not menu_results:
-            menu_results.append({
-                "Title": "No context actions available",
-                "IcoPath": icon_path
-            })
+            menu_results.append(_NO_CONTEXT_ACTIONS_RESULT.copy())
         
         return menu_results
 
     def open_url(self, url: str):
         """Open URL in browser"""
+        import webbrowser
         webbrowser.open(url)
 
     def shell_run(self, command: Union[str, List[str]]):
         """Execute shell command"""
-        cmd_str = command[0] if isinstance(command, list) and command else str(command)
-        payload = {
-            "method": "Flow.Launcher.ShellRun",
-            "parameters": [cmd_str]
-        }
-        print(json.dumps(payload))
+        cmd_str = _as_str(command[0] if type(command) is list and command else command)
+        _emit_rpc("Flow.Launcher.ShellRun", [cmd_str])
 
     def copy_to_clipboard(self, text: Any, directCopy: Union[str, bool] = False, showDefaultNotification: Union[str, bool] = True):
         """Copy text to clipboard"""
-        text_to_copy = str(text)
+        text_to_copy = _as_str(text)
         
         # Convert string bools if needed
-        should_direct_copy = str(directCopy).lower() == 'true' if isinstance(directCopy, str) else bool(directCopy)
-        should_show_notification = str(showDefaultNotification).lower() == 'true' if isinstance(showDefaultNotification, str) else bool(showDefaultNotification)
+        should_direct_copy = _as_bool(directCopy)
+        should_show_notification = _as_bool(showDefaultNotification)
         
-        payload = {
-            "method": "Flow.Launcher.CopyToClipboard",
-            "parameters": [text_to_copy, should_direct_copy, should_show_notification]
-        }
-        print(json.dumps(payload))
+        _emit_rpc("Flow.Launcher.CopyToClipboard",
+                  [text_to_copy, should_direct_copy, should_show_notification])
 
     def change_query(self, new_query: str, requery: Union[str, bool] = "false"):
         """Change query"""
-        should_requery = str(requery).lower() == 'true' if isinstance(requery, str) else bool(requery)
+        should_requery = _as_bool(requery)
         FlowLauncherAPI.change_query(new_query, requery=should_requery)
 
     def flow_show_msg(self, title: str, sub_title: str, ico_path: Optional[str] = None):
         """Show message"""
-        icon = ico_path or "Images/icon.png"
-        payload = {
-            "method": "Flow.Launcher.ShowMsg",
-            "parameters": [str(title), str(sub_title), icon]
-        }
-        print(json.dumps(payload))
+        icon = ico_path or _ICON
+        _emit_rpc("Flow.Launcher.ShowMsg", [_as_str(title), _as_str(sub_title), icon])
 
 
 if __name__ == "__main__":